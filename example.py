@@ -1,13 +1,17 @@
-import datetime
-import json
+import asyncio
+import concurrent.futures
+import functools
+import hashlib
+import operator
+import os
+import struct
 import time
-from binascii import hexlify, unhexlify
-from pathlib import Path
-from typing import List
+from typing import List, Tuple
 
 import requests
-import sha3
-from symbolchain.CryptoTypes import PrivateKey, PublicKey
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from symbolchain.CryptoTypes import Hash256, PrivateKey, PublicKey
 from symbolchain.facade.SymbolFacade import SymbolFacade
 from symbolchain.PrivateKeyStorage import PrivateKeyStorage
 from symbolchain.sc import (AggregateCompleteTransaction, Amount,
@@ -20,6 +24,60 @@ from symbolchain.sc import (AggregateCompleteTransaction, Amount,
 from symbolchain.symbol.KeyPair import KeyPair
 from symbolchain.symbol.Network import Address
 
+try:
+    from symbolchain.symbol.Merkle import MerkleHashBuilder
+except ImportError:
+    from symbolchain.symbol.MerkleHashBuilder import MerkleHashBuilder
+
+try:
+    from orjson import loads as json_loads
+except ImportError:
+    from json import loads as json_loads
+
+# transferable, supply_mutable, restrictable, revokableの組み合わせ(4bit)に対応するMosaicFlags
+_MOSAIC_FLAGS = (MosaicFlags.TRANSFERABLE, MosaicFlags.SUPPLY_MUTABLE, MosaicFlags.RESTRICTABLE, MosaicFlags.REVOKABLE)
+_MOSAIC_FLAG_TABLE = [
+    functools.reduce(
+        operator.or_,
+        [flag for n, flag in enumerate(_MOSAIC_FLAGS) if i & (1 << n)],
+        MosaicFlags.NONE
+    )
+    for i in range(1 << len(_MOSAIC_FLAGS))
+]
+
+# アナウンス失敗時の再送設定(requestsとaiohttpで共通)
+_RETRY_TOTAL = 3
+_RETRY_STATUS_CODES = (500, 502, 503, 504)
+_RETRY_BACKOFF_FACTOR = 0.3
+
+
+@functools.lru_cache(maxsize=None)
+def get_facade(network_name: str) -> SymbolFacade:
+    """
+    ネットワーク毎にSymbolFacadeを1つだけ生成して共有する
+    """
+    return SymbolFacade(network_name)
+
+
+class TransactionRejected(Exception):
+    """
+    ノードがトランザクションを受け付けなかった
+    """
+
+
+class PartialAnnounceError(Exception):
+    """
+    複数トランザクションのアナウンスで一部が失敗した
+
+    tx_hashesはtransactionsと同じ順に並び、失敗したものはNoneになる
+    errorsは失敗したトランザクションのインデックスと例外の辞書
+    """
+
+    def __init__(self, tx_hashes: list, errors: dict) -> None:
+        super().__init__("{} of {} transactions failed".format(len(errors), len(tx_hashes)))
+        self.tx_hashes = tx_hashes
+        self.errors = errors
+
 
 class NonceGenerator:
 
@@ -28,7 +86,7 @@ class NonceGenerator:
         """
         ナンスを生成する
         """
-        return int(time.mktime(datetime.datetime.now().timetuple()))
+        return int(time.time())
 
 
 class AccountConfig:
@@ -38,19 +96,19 @@ class AccountConfig:
         """
         アカウント情報を*.pemファイルに保存する
         """
-        file = Path(pem_file_path)
-        storage = PrivateKeyStorage(file.parent, password)
-        return KeyPair(storage.load(file.stem))
+        directory, file_name = os.path.split(pem_file_path)
+        storage = PrivateKeyStorage(directory or ".", password)
+        return KeyPair(storage.load(os.path.splitext(file_name)[0]))
 
     @staticmethod
     def save_pem(pem_file_path: str, raw_private_key: str, password: str = None):
         """
         アカウント情報を*.pemファイルから読み込む
         """
-        file = Path(pem_file_path)
-        private_key = PrivateKey(unhexlify(raw_private_key))
-        storage = PrivateKeyStorage(file.parent, password)
-        storage.save(file.stem, private_key)
+        directory, file_name = os.path.split(pem_file_path)
+        private_key = PrivateKey(bytes.fromhex(raw_private_key))
+        storage = PrivateKeyStorage(directory or ".", password)
+        storage.save(os.path.splitext(file_name)[0], private_key)
 
     def public_key_to_addres(facade: SymbolFacade, public_key: PublicKey) -> Address:
         """
@@ -66,51 +124,104 @@ class KeyGenerator:
         # 下記コマンドと互換
         # $ symbol-cli converter stringToKey -v header
         # AD6D8491D21180E5D
-        hasher = sha3.sha3_256()
-        hasher.update(input.encode())
-        digest = hasher.digest()
-        result = int.from_bytes(digest[0:8], "little")
+        digest = hashlib.sha3_256(input.encode()).digest()
+        result = struct.unpack_from("<Q", digest)[0]
         return result
 
 
+class HTTPSessionFactory:
+
+    @staticmethod
+    def create() -> requests.Session:
+        """
+        コネクションプール付きのHTTPセッションを作成する
+        """
+        session = requests.Session()
+        adapter = HTTPAdapter(
+            pool_connections=4,
+            pool_maxsize=8,
+            # 署名済みトランザクションのアナウンスは同じハッシュになるため、PUTも再送してよい
+            max_retries=Retry(
+                total=_RETRY_TOTAL,
+                status_forcelist=_RETRY_STATUS_CODES,
+                allowed_methods=["PUT", "GET"],
+                backoff_factor=_RETRY_BACKOFF_FACTOR,
+                raise_on_status=False
+            )
+        )
+        session.mount("http://", adapter)
+        session.mount("https://", adapter)
+        return session
+
+
 class CatapultRESTAPI:
 
-    def __init__(self, node_url: str) -> None:
+    def __init__(self, node_url: str, session: requests.Session = None) -> None:
         self._node_url = node_url
+        self._session = session if session is not None else HTTPSessionFactory.create()
+        self._props = None
+
+    def _get_properties(self) -> dict:
+        """
+        /network/propertiesを取得する(初回のみ通信し、以降はキャッシュを返す)
+        """
+        if self._props is None:
+            url = self._node_url + "/network/properties"
+            response = self._session.get(url, stream=False, timeout=(3, 10))
+            response.raise_for_status()
+            self._props = json_loads(response.content)
+        return self._props
 
     def get_epoch_adjustment(self) -> int:
         """
         epochAdjustmentを取得する
         """
-        url = self._node_url + "/network/properties"
-        response = requests.get(url)
-        if response.status_code != 200:
-            raise Exception("status code is {}".format(response.status_code))
-        contents = json.loads(response.text)
-        epoch_adjustment = int(contents["network"]["epochAdjustment"].replace("s", ""))
+        props = self._get_properties()
+        raw = props["network"]["epochAdjustment"]
+        epoch_adjustment = int(raw[:-1] if raw.endswith("s") else raw)
         return epoch_adjustment
 
     def get_currency_mosaic_id(self) -> int:
         """
         currencyMosaicIdを取得する
         """
-        url = self._node_url + "/network/properties"
-        response = requests.get(url)
-        if response.status_code != 200:
-            raise Exception("status code is {}".format(response.status_code))
-        contents = json.loads(response.text)
-        currency_mosaic_id = int(contents["chain"]["currencyMosaicId"].replace("'", ""), 16)
+        props = self._get_properties()
+        # 0x72619171'D5D975B9 の形式で返される
+        raw = props["chain"]["currencyMosaicId"]
+        high, _, low = raw.partition("'")
+        currency_mosaic_id = int(high + low, 16)
         return currency_mosaic_id
 
 
 class SymbolTransactionCreator:
 
-    def __init__(self, network_name: str, node_url: str, epoch_adjustment: int, max_fee: int, expiration_hour: int) -> None:
-        self._facade = SymbolFacade(network_name)
+    def __init__(
+        self,
+        network_name: str,
+        node_url: str,
+        epoch_adjustment: int,
+        max_fee: int,
+        expiration_hour: int,
+        session: requests.Session = None
+    ) -> None:
+        self._facade = get_facade(network_name)
+        self._factory = self._facade.transaction_factory
+        self._hash_embedded = self._facade.hash_embedded_transactions
+        self._embedded_hash_cache = {}
         self._node_url = node_url
+        self._session = session if session is not None else HTTPSessionFactory.create()
         self._epoch_adjustment = epoch_adjustment
         self._max_fee = Amount(max_fee)
-        self._expiration_hour = expiration_hour
+        self._expiration_seconds = expiration_hour * 3600
+        self._transfer_tpl = {
+            "type": "transfer_transaction",
+            "signer_public_key": None,
+            "deadline": None,
+            "fee": self._max_fee,
+            "recipient_address": None,
+            "mosaics": None,
+            "message": None
+        }
         if network_name == "mainnet":
             self._explorer_url = "https://symbol.fyi/transactions/"
         elif network_name == "testnet":
@@ -119,10 +230,48 @@ class SymbolTransactionCreator:
             raise Exception("Unknown network name.")
 
     def _get_deadline(self):
-        deadline = (int((datetime.datetime.today() + datetime.timedelta(hours=self._expiration_hour)
-                         ).timestamp()) - self._epoch_adjustment) * 1000
+        deadline = (int(time.time()) + self._expiration_seconds - self._epoch_adjustment) * 1000
         return deadline
 
+    def _hash_embedded_cached(self, inner_txs: list):
+        """
+        インナートランザクションのハッシュを計算する(内容が同じインナートランザクションの組は再計算しない)
+        """
+        # 作成後に書き換えられたインナートランザクションを区別するため、シリアライズ結果をキーにする
+        # シリアライズは1回だけ行い、キャッシュにない場合はその結果からハッシュを計算する
+        # (SymbolFacade.hash_embedded_transactionsと同じ計算)
+        serialized_txs = [inner_tx.serialize() for inner_tx in inner_txs]
+        key = b"".join(serialized_txs)
+        transactions_hash = self._embedded_hash_cache.get(key)
+        if transactions_hash is None:
+            hash_builder = MerkleHashBuilder()
+            for serialized_tx in serialized_txs:
+                hash_builder.update(Hash256(hashlib.sha3_256(serialized_tx).digest()))
+            transactions_hash = hash_builder.final()
+            if len(self._embedded_hash_cache) >= 64:
+                del self._embedded_hash_cache[next(iter(self._embedded_hash_cache))]
+            self._embedded_hash_cache[key] = transactions_hash
+        return transactions_hash
+
+    def _create_aggregate_transaction(
+        self,
+        signer_public_key: PublicKey,
+        inner_txs: list,
+        transactions_hash
+    ) -> AggregateCompleteTransaction:
+        deadline = self._get_deadline()
+
+        aggre_tx: AggregateCompleteTransaction = self._factory.create({
+            "type": "aggregate_complete_transaction",
+            "signer_public_key": signer_public_key,
+            "fee": self._max_fee,
+            "deadline": deadline,
+            "transactions_hash":  transactions_hash,
+            "transactions": inner_txs
+        })
+
+        return aggre_tx
+
     def create_transfer_transaction(
         self,
         signer_public_key: PublicKey,
@@ -136,17 +285,16 @@ class SymbolTransactionCreator:
 
         deadline = self._get_deadline()
 
-        tx: TransferTransaction = self._facade.transaction_factory.create({
-            "type": "transfer_transaction",
-            "signer_public_key": signer_public_key,
-            "deadline": deadline,
-            "fee": self._max_fee,
-            "recipient_address": recipient_address,
-            "mosaics": mosaics,
-            # NOTE: additional 0 byte at the beginning is added for compatibility with explorer
-            # and other tools that treat messages starting with 00 byte as "plain text"
-            "message": bytes(1) + message.encode("utf8")
-        })
+        descriptor = self._transfer_tpl.copy()
+        descriptor["signer_public_key"] = signer_public_key
+        descriptor["deadline"] = deadline
+        descriptor["recipient_address"] = recipient_address
+        descriptor["mosaics"] = mosaics
+        # NOTE: additional 0 byte at the beginning is added for compatibility with explorer
+        # and other tools that treat messages starting with 00 byte as "plain text"
+        descriptor["message"] = b"\x00" + message.encode("utf8")
+
+        tx: TransferTransaction = self._factory.create(descriptor)
 
         return tx
 
@@ -162,33 +310,39 @@ class SymbolTransactionCreator:
         https://docs.symbol.dev/guides/aggregate/sending-multiple-transactions-together-with-aggregate-complete-transaction.html
         """
 
-        deadline = self._get_deadline()
-
         # インナートランザクションを作成する
-        inner_txs: List[EmbeddedTransferTransaction] = []
-        for message in messages:
-            inner_tx: EmbeddedTransferTransaction = self._facade.transaction_factory.create_embedded({
+        create_embedded = self._factory.create_embedded
+        inner_txs: List[EmbeddedTransferTransaction] = [
+            create_embedded({
                 "type": "transfer_transaction",
                 "signer_public_key": signer_public_key,
                 "recipient_address": recipient_address,
                 "mosaics": mosaics,
                 # NOTE: additional 0 byte at the beginning is added for compatibility with explorer
                 # and other tools that treat messages starting with 00 byte as "plain text"
-                "message": bytes(1) + message.encode("utf8")
+                "message": b"\x00" + message.encode("utf8")
             })
-            inner_txs.append(inner_tx)
+            for message in messages
+        ]
 
         # アグリゲートトランザクションを作成する
-        aggre_tx: AggregateCompleteTransaction = self._facade.transaction_factory.create({
-            "type": "aggregate_complete_transaction",
-            "signer_public_key": signer_public_key,
-            "fee": self._max_fee,
-            "deadline": deadline,
-            "transactions_hash":  self._facade.hash_embedded_transactions(inner_txs),
-            "transactions": inner_txs
-        })
+        return self._create_aggregate_transaction(signer_public_key, inner_txs, self._hash_embedded(inner_txs))
 
-        return aggre_tx
+    def create_aggregate_complete_transaction(
+        self,
+        signer_public_key: PublicKey,
+        inner_txs: list
+    ) -> AggregateCompleteTransaction:
+        """
+        作成済みのインナートランザクションからアグリゲートトランザクションを作成する
+
+        ノードに拒否されたトランザクションを内容が同じインナートランザクションで作り直す場合、
+        インナートランザクションのハッシュは再計算しない
+        """
+
+        return self._create_aggregate_transaction(
+            signer_public_key, inner_txs, self._hash_embedded_cached(inner_txs)
+        )
 
     def create_mosaic_definition_transaction(
             self,
@@ -211,13 +365,11 @@ class SymbolTransactionCreator:
 
         deadline = self._get_deadline()
 
-        flags = MosaicFlags.NONE
-        flags = flags | MosaicFlags.TRANSFERABLE if transferable else flags
-        flags = flags | MosaicFlags.SUPPLY_MUTABLE if supply_mutable else flags
-        flags = flags | MosaicFlags.RESTRICTABLE if restrictable else flags
-        flags = flags | MosaicFlags.REVOKABLE if revokable else flags
+        flags = _MOSAIC_FLAG_TABLE[
+            bool(transferable) | bool(supply_mutable) << 1 | bool(restrictable) << 2 | bool(revokable) << 3
+        ]
 
-        tx: MosaicDefinitionTransaction = self._facade.transaction_factory.create({
+        tx: MosaicDefinitionTransaction = self._factory.create({
             "type": "mosaic_definition_transaction",
             "signer_public_key": signer_public_key,
             "deadline": deadline,
@@ -247,7 +399,7 @@ class SymbolTransactionCreator:
 
         deadline = self._get_deadline()
 
-        tx: MosaicSupplyChangeTransaction = self._facade.transaction_factory.create({
+        tx: MosaicSupplyChangeTransaction = self._factory.create({
             "type": "mosaic_supply_change_transaction",
             "signer_public_key": signer_public_key,
             "deadline": deadline,
@@ -277,34 +429,26 @@ class SymbolTransactionCreator:
         $ symbol-cli transaction mosaicmetadata --max-fee 2000000 --mode normal --mosaic-id 251208ED3D0ABC84 --target-address TBCSXNJ6FTO2BQUAI7ZOIGVQKOARQ7ADKLSKIRI --key AD6D8491D21180E5 --value transactionhash
         """
 
-        deadline = self._get_deadline()
-
         # MetadataTransactionはInnerTransactionが1つの場合でもAggregateTransactionにする必要がある。
         # AggregateTransactionにしない場合、リクエスト自体は202で受け付けられるが、反映されることはなかった。
         # Desktop Wallet、CLIでも操作しても必ずAggregateTransactionになるので、そういう仕様かも。
 
+        payload = value.encode("utf8")
+
         # インナートランザクションを作成する
-        tx: EmbeddedMosaicMetadataTransaction = self._facade.transaction_factory.create_embedded({
+        tx: EmbeddedMosaicMetadataTransaction = self._factory.create_embedded({
             "type": "mosaic_metadata_transaction",
             "signer_public_key": signer_public_key,
             "target_address": target_address,
             "target_mosaic_id": target_mosaic_id,
             "scoped_metadata_key": KeyGenerator.generate_uint64_key(scoped_metadata_key),
-            "value": value.encode("utf8"),
-            "value_size_delta": len(value.encode("utf8"))
+            "value": payload,
+            "value_size_delta": len(payload)
         })
 
         # アグリゲートトランザクションを作成する
-        aggre_tx: AggregateCompleteTransaction = self._facade.transaction_factory.create({
-            "type": "aggregate_complete_transaction",
-            "signer_public_key": signer_public_key,
-            "fee": self._max_fee,
-            "deadline": deadline,
-            "transactions_hash":  self._facade.hash_embedded_transactions([tx]),
-            "transactions": [tx]
-        })
-
-        return aggre_tx
+        inner_txs = [tx]
+        return self._create_aggregate_transaction(signer_public_key, inner_txs, self._hash_embedded(inner_txs))
 
     def sign_and_announce_transaction(self, transaction, key_pair: KeyPair) -> str:
         """
@@ -321,22 +465,118 @@ class SymbolTransactionCreator:
         """
 
         # トランザクションを署名する
-        signature = self._facade.sign_transaction(key_pair, transaction)
+        payload, tx_hash = self.sign_transaction(transaction, key_pair)
 
         # ノードにアナウンスする
+        return self.announce_transaction(payload, tx_hash)
+
+    def announce_transaction(self, payload: bytes, tx_hash: str) -> str:
+        """
+        署名済みのトランザクションをノードにアナウンスする
+        """
         url = self._node_url + "/transactions"
         http_headers = {"Content-type": "application/json"}
-        payload = self._facade.transaction_factory.attach_signature(transaction, signature).encode()
-        tx_hash = self._facade.hash_transaction(transaction)
-        response = requests.put(url, headers=http_headers, data=payload)
-        if response.status_code != 202:
-            raise Exception("status code is {}".format(response.status_code))
+        response = self._session.put(url, headers=http_headers, data=payload, timeout=(3, 10))
+        if response.status_code != 202 and response.status_code < 500:
+            raise TransactionRejected("status code is {}: {}".format(response.status_code, response.text))
+        response.raise_for_status()
 
-        print("tx hash:" + str(tx_hash))
+        print("tx hash:" + tx_hash)
         print("status code:" + str(response.status_code))
-        print(self._explorer_url + str(tx_hash))
+        print(self._explorer_url + tx_hash)
+
+        return tx_hash
+
+    def announce_many(self, transactions: list, key_pair: KeyPair, max_workers: int = 4) -> List[str]:
+        """
+        複数のトランザクションを署名し、ノードにアナウンスする
+
+        署名はスレッドプールで行い、署名が終わったものから順にアナウンスする
+        戻り値のトランザクションハッシュはtransactionsと同じ順に並ぶ
+        一部が失敗しても残りのアナウンスは続け、最後にPartialAnnounceErrorを送出する
+        """
+        tx_hashes = [None] * len(transactions)
+        errors = {}
+        with concurrent.futures.ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = {
+                executor.submit(self.sign_transaction, transaction, key_pair): index
+                for index, transaction in enumerate(transactions)
+            }
+            for future in concurrent.futures.as_completed(futures):
+                index = futures[future]
+                try:
+                    payload, tx_hash = future.result()
+                    tx_hashes[index] = self.announce_transaction(payload, tx_hash)
+                except Exception as e:
+                    errors[index] = e
+        if errors:
+            raise PartialAnnounceError(tx_hashes, errors)
+        return tx_hashes
+
+    def sign_transaction(self, transaction, key_pair: KeyPair) -> Tuple[bytes, str]:
+        """
+        トランザクションを署名し、アナウンス用のペイロードとトランザクションハッシュを返す
+        """
+        signature = self._facade.sign_transaction(key_pair, transaction)
+        payload = self._factory.attach_signature(transaction, signature).encode()
+        tx_hash = self._facade.hash_transaction(transaction)
+        return payload, str(tx_hash)
 
-        return str(tx_hash)
+    async def announce_async(self, session, payload: bytes, tx_hash: str) -> str:
+        """
+        署名済みのトランザクションを非同期でノードにアナウンスする
+
+        sessionにはaiohttp.ClientSessionを指定する
+        同期版と同様に、500/502/503/504は間隔を空けて再送する
+        """
+        url = self._node_url + "/transactions"
+        http_headers = {"Content-type": "application/json"}
+        for attempt in range(_RETRY_TOTAL + 1):
+            if attempt > 0:
+                await asyncio.sleep(_RETRY_BACKOFF_FACTOR * (2 ** (attempt - 1)))
+            async with session.put(url, headers=http_headers, data=payload) as response:
+                if response.status in _RETRY_STATUS_CODES and attempt < _RETRY_TOTAL:
+                    continue
+                if response.status != 202 and response.status < 500:
+                    raise TransactionRejected("status code is {}: {}".format(response.status, await response.text()))
+                response.raise_for_status()
+                break
+
+        print("tx hash:" + tx_hash)
+        print("status code:" + str(response.status))
+        print(self._explorer_url + tx_hash)
+
+        return tx_hash
+
+    async def sign_and_announce_transactions_async(self, transactions: list, key_pair: KeyPair) -> List[str]:
+        """
+        複数のトランザクションを署名し、並行してノードにアナウンスする
+
+        署名は同期的に行い、通信のみを並行させる
+        戻り値のトランザクションハッシュはtransactionsと同じ順に並ぶ
+        一部が失敗しても残りのアナウンスは続け、最後にPartialAnnounceErrorを送出する
+        """
+        import aiohttp
+
+        signed_txs = [self.sign_transaction(transaction, key_pair) for transaction in transactions]
+
+        connector = aiohttp.TCPConnector(limit=16)
+        timeout = aiohttp.ClientTimeout(connect=3, sock_read=10)
+        async with aiohttp.ClientSession(connector=connector, timeout=timeout) as session:
+            results = await asyncio.gather(*[
+                self.announce_async(session, payload, tx_hash) for payload, tx_hash in signed_txs
+            ], return_exceptions=True)
+
+        tx_hashes = [None] * len(results)
+        errors = {}
+        for index, result in enumerate(results):
+            if isinstance(result, BaseException):
+                errors[index] = result
+            else:
+                tx_hashes[index] = result
+        if errors:
+            raise PartialAnnounceError(tx_hashes, errors)
+        return tx_hashes
 
 
 if __name__ == "__main__":
@@ -344,7 +584,8 @@ if __name__ == "__main__":
     # ネットワーク情報
     network_name = "testnet"
     node_url = "https://node3.xym-harvesting.com:3001"
-    catapult_api = CatapultRESTAPI(node_url)
+    session = HTTPSessionFactory.create()
+    catapult_api = CatapultRESTAPI(node_url, session)
     epoch_adjustment = catapult_api.get_epoch_adjustment()      # 1637848847
     currency_mosaic_id = catapult_api.get_currency_mosaic_id()  # symbol.xym, 0x3A8416DB2D53B6C8
 
@@ -353,7 +594,7 @@ if __name__ == "__main__":
     max_fee = 2000000
 
     # アカウント情報(送信元および発行者)
-    facade = SymbolFacade(network_name)
+    facade = get_facade(network_name)
     # AccountConfig.save_pem("./configs/private_key.pem", "PRIVATE_KEY", "PASSWORD")
     sender_key_pair = AccountConfig.load_pem("./configs/private_key.pem", "PASSWORD")
     sender_public_key = sender_key_pair.public_key
@@ -364,7 +605,7 @@ if __name__ == "__main__":
     recipient_address = Address("TA3HQR6NPMXK7W6EP3AO6X5S4OSHVBU3ZEWBTNQ")
 
     creator = SymbolTransactionCreator(
-        network_name, node_url, epoch_adjustment, max_fee, expiration_hour
+        network_name, node_url, epoch_adjustment, max_fee, expiration_hour, session
     )
 
     # ↓ 試したいものをアンコメント
@@ -400,3 +641,19 @@ if __name__ == "__main__":
     #     sender_public_key, sender_address, 0x251208ED3D0ABC84, "metadata key", "metadata value"
     # )
     # creator.sign_and_announce_transaction(tx, sender_key_pair)
+
+    # 複数のトランザクションを署名しながらアナウンスする
+    # mosaics = [{"mosaic_id": currency_mosaic_id, "amount": int(1 * 1000000)}]
+    # txs = [
+    #     creator.create_transfer_transaction(sender_public_key, recipient_address, mosaics, "hello symbol " + str(i))
+    #     for i in range(3)
+    # ]
+    # creator.announce_many(txs, sender_key_pair)
+
+    # 複数のトランザクションを並行してアナウンスする(aiohttpが必要)
+    # mosaics = [{"mosaic_id": currency_mosaic_id, "amount": int(1 * 1000000)}]
+    # txs = [
+    #     creator.create_transfer_transaction(sender_public_key, recipient_address, mosaics, "hello symbol " + str(i))
+    #     for i in range(3)
+    # ]
+    # asyncio.run(creator.sign_and_announce_transactions_async(txs, sender_key_pair))